@@ -26,12 +26,13 @@ setup(
     install_requires=[
         # Core Voice Processing
         "pyttsx3>=2.90",
-        "vosk>=0.3.45",
-        "pyaudio>=0.2.13",
+        "vosk>=0.3.45",  # only needed with audio.use_vosk
+        "openwakeword>=0.6.0",
         "sounddevice>=0.4.6",
         "soundfile>=0.12.1",
         "webrtcvad>=2.0.10",
-        "whisper>=1.1.10",
+        "faster-whisper>=1.0.0",
+        "ctranslate2>=4.0.0",
         
         # AI and NLP
         "transformers>=4.37.2",
@@ -39,10 +40,11 @@ setup(
         "sentence-transformers>=2.2.2",
         "spacy>=3.7.2",
         "faiss-cpu>=1.7.4",
+        "numba>=0.58.1",
         
         # System and Utils
         "psutil>=5.9.6",
-        "pyyaml>=6.0.1",
+        "pyyaml>=6.0.1",  # build against libyaml to enable the C loader
         "python-dotenv>=1.0.0",
         "aiohttp>=3.9.1",
         "apscheduler>=3.10.4",
@@ -1,11 +1,40 @@
 """Configuration management for JARVIS."""
 import os
+import pickle
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import yaml
 
 from .utils.exceptions import ConfigError
+from .utils.files import atomic_path
+
+# Prefer the libyaml-backed loader when PyYAML was built against it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bump when the layout of the pickled config cache changes
+_CACHE_VERSION = 1
+_MISSING = object()
+
+
+def _flatten(node: Any, prefix: Tuple[str, ...] = ()) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    """Yield every key path in a nested dict along with its value.
+    
+    Internal nodes are yielded as well as leaves, so partial paths
+    resolve to their subtree.
+    
+    Args:
+        node: Nested configuration value
+        prefix: Key path leading to ``node``
+        
+    Yields:
+        Tuples of (key path, value)
+    """
+    yield prefix, node
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from _flatten(value, prefix + (key,))
+
 
 class Config:
     """Configuration manager for JARVIS."""
@@ -20,9 +49,16 @@ class Config:
         self.settings = self._load_yaml("settings.yaml")
         self.responses = self._load_yaml("responses.yaml")
         
+        # Key path -> value indexes so lookups are a single dict probe
+        self._settings_flat: Dict[Tuple[str, ...], Any] = dict(_flatten(self.settings))
+        self._responses_flat: Dict[Tuple[str, ...], Any] = dict(_flatten(self.responses))
+        
     def _load_yaml(self, filename: str) -> Dict[str, Any]:
         """Load a YAML configuration file.
         
+        A pickled copy is kept next to the YAML file and reused as long as
+        the source file's mtime and size are unchanged.
+        
         Args:
             filename: Name of the YAML file to load
             
@@ -32,11 +68,60 @@ class Config:
         Raises:
             ConfigError: If the file cannot be loaded
         """
+        path = self.config_dir / filename
         try:
-            with open(self.config_dir / filename, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            stat = path.stat()
+            data = self._read_cache(path, stat)
+            if data is not _MISSING:
+                return data
+            with open(path, 'r', encoding='utf-8') as f:
+                data = yaml.load(f, Loader=_YAML_LOADER)
         except Exception as e:
             raise ConfigError(f"Failed to load {filename}: {str(e)}")
+        self._write_cache(path, stat, data)
+        return data
+    
+    @staticmethod
+    def _cache_path(path: Path) -> Path:
+        """Get the pickle cache path for a YAML file."""
+        return path.with_suffix(path.suffix + ".pkl")
+    
+    def _read_cache(self, path: Path, stat: os.stat_result) -> Any:
+        """Read cached configuration if it is still fresh.
+        
+        Args:
+            path: Path of the source YAML file
+            stat: Current stat result of the source file
+            
+        Returns:
+            Cached configuration, or ``_MISSING`` if absent or stale
+        """
+        try:
+            with open(self._cache_path(path), 'rb') as f:
+                version, mtime_ns, size, data = pickle.load(f)
+        except Exception:
+            return _MISSING
+        if (version, mtime_ns, size) != (_CACHE_VERSION, stat.st_mtime_ns, stat.st_size):
+            return _MISSING
+        return data
+    
+    def _write_cache(self, path: Path, stat: os.stat_result, data: Any) -> None:
+        """Write parsed configuration to the pickle cache.
+        
+        Failures are ignored so a read-only config directory still works.
+        
+        Args:
+            path: Path of the source YAML file
+            stat: Stat result of the source file at parse time
+            data: Parsed configuration
+        """
+        payload = (_CACHE_VERSION, stat.st_mtime_ns, stat.st_size, data)
+        try:
+            with atomic_path(self._cache_path(path)) as tmp:
+                with open(tmp, 'wb') as f:
+                    pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            pass
     
     def get_setting(self, *keys: str, default: Any = None) -> Any:
         """Get a setting value using dot notation.
@@ -48,12 +133,7 @@ class Config:
         Returns:
             The setting value or default
         """
-        current = self.settings
-        for key in keys:
-            if not isinstance(current, dict):
-                return default
-            current = current.get(key, default)
-        return current
+        return self._settings_flat.get(keys, default)
     
     def get_response(self, *keys: str, default: Any = None) -> Any:
         """Get a response template using dot notation.
@@ -65,9 +145,4 @@ class Config:
         Returns:
             The response template or default
         """
-        current = self.responses
-        for key in keys:
-            if not isinstance(current, dict):
-                return default
-            current = current.get(key, default)
-        return current 
\ No newline at end of file
+        return self._responses_flat.get(keys, default) 
\ No newline at end of file
@@ -1,10 +1,20 @@
 """Conversation management for JARVIS."""
 import random
-from typing import Any, Dict, List, Optional
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
 from ..config import Config
 from ..utils.exceptions import ConversationError
+from ..utils.keywords import KeywordMatcher
+
+# Used when responses.yaml has no mood_keywords; earlier moods win ties
+DEFAULT_MOOD_KEYWORDS: Dict[str, List[str]] = {
+    'happy': ['great', 'awesome', 'amazing'],
+    'sad': ['sad', 'tired', 'upset'],
+    'energetic': ['lets go', 'come on', 'hurry'],
+}
 
 class ConversationManager:
     """Manage conversations and responses."""
@@ -19,8 +29,15 @@ class ConversationManager:
         self.context: Dict[str, Any] = {
             'last_interaction': None,
             'current_mood': 'neutral',
-            'conversation_history': []
+            'conversation_history': deque(
+                maxlen=config.get_setting('conversation', 'history_len', default=500)
+            )
         }
+        # (category, subcategory, mood) -> resolved response candidates
+        self._response_pools: Dict[Tuple[str, Optional[str], str], Union[Tuple[str, ...], str]] = {}
+        self._mood_matcher = KeywordMatcher(
+            config.get_response('mood_keywords', default=DEFAULT_MOOD_KEYWORDS)
+        )
         
     def get_response(self, category: str, subcategory: str = None, 
                     mood: str = None) -> str:
@@ -39,24 +56,50 @@ class ConversationManager:
         """
         try:
             mood = mood or self.context['current_mood']
-            responses = self.config.get_response(category)
-            
-            if not responses:
-                raise ConversationError(f"No responses found for category: {category}")
-                
-            if subcategory:
-                responses = responses.get(subcategory, responses)
+            key = (category, subcategory, mood)
+            pool = self._response_pools.get(key)
+            if pool is None:
+                pool = self._response_pools[key] = self._resolve_responses(
+                    category, subcategory, mood
+                )
                 
-            if isinstance(responses, dict) and mood in responses:
-                responses = responses[mood]
-                
-            if isinstance(responses, list):
-                return random.choice(responses)
-            return str(responses)
+            if isinstance(pool, tuple):
+                return random.choice(pool)
+            return pool
             
         except Exception as e:
             raise ConversationError(f"Failed to get response: {str(e)}")
     
+    def _resolve_responses(self, category: str, subcategory: Optional[str],
+                           mood: str) -> Union[Tuple[str, ...], str]:
+        """Resolve the response candidates for a category and mood.
+        
+        Args:
+            category: Response category
+            subcategory: Optional subcategory
+            mood: Mood to select responses for
+            
+        Returns:
+            Tuple of candidate responses, or a single response string
+            
+        Raises:
+            ConversationError: If no responses exist for the category
+        """
+        responses = self.config.get_response(category)
+        
+        if not responses:
+            raise ConversationError(f"No responses found for category: {category}")
+            
+        if subcategory:
+            responses = responses.get(subcategory, responses)
+            
+        if isinstance(responses, dict) and mood in responses:
+            responses = responses[mood]
+            
+        if isinstance(responses, (list, tuple)):
+            return tuple(responses)
+        return str(responses)
+    
     def update_context(self, **kwargs) -> None:
         """Update conversation context.
         
@@ -74,7 +117,7 @@ class ConversationManager:
             message: The message content
         """
         self.context['conversation_history'].append({
-            'timestamp': datetime.now(),
+            'timestamp': time.time(),
             'speaker': speaker,
             'message': message
         })
@@ -98,10 +141,4 @@ class ConversationManager:
         """
         # TODO: Implement more sophisticated mood detection
         # For now, use simple keyword matching
-        if any(word in message.lower() for word in ['great', 'awesome', 'amazing']):
-            return 'happy'
-        elif any(word in message.lower() for word in ['sad', 'tired', 'upset']):
-            return 'sad'
-        elif any(word in message.lower() for word in ['lets go', 'come on', 'hurry']):
-            return 'energetic'
-        return 'neutral' 
\ No newline at end of file
+        return self._mood_matcher.match(message) or 'neutral'
\ No newline at end of file
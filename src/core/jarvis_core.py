@@ -55,6 +55,12 @@ class Jarvis:
         """Start JARVIS."""
         self.running = True
         self.logger.info("JARVIS is starting up...")
+        if not self.voice.use_vosk and self.config.get_response('wake_phrases'):
+            self.logger.warning(
+                "Configured wake_phrases are ignored: wake word detection uses the "
+                "'%s' model; set audio.use_vosk to listen for them",
+                self.config.get_setting('audio', 'wake_model', default='hey_jarvis')
+            )
         
         # Create and start status indicator
         self.status_indicator.create_window()
@@ -65,37 +71,54 @@ class Jarvis:
             self.conversation.get_response('greetings', mood='energetic')
         )
         
+        # Monitor system status in the background
+        asyncio.create_task(self._monitor_loop())
+        
         try:
+            # Utterances are pushed by the audio callback; wait for the next one
+            self.voice.start_capture()
             while self.running:
-                # Monitor system status
-                status = self.monitor.get_system_status()
-                if status['cpu_percent'] > 90 or status['memory_percent'] > 90:
-                    self.logger.warning("System resources critical!")
-                    
-                # Listen for wake word or command
-                audio = await self.voice.listen(timeout=5.0)
-                if audio:
-                    if self.voice.detect_wake_word(audio):
-                        self.status_indicator.set_status(JarvisStatus.LISTENING)
-                        await self.handle_interaction()
-                    else:
-                        self.status_indicator.set_status(JarvisStatus.IDLE)
-                        
-                # Small delay to prevent CPU hogging
-                await asyncio.sleep(0.1)
+                audio = await self.voice.next_segment()
+                if audio is None:
+                    # Capture stopped; stop() has cleared running
+                    continue
+                if self.voice.detect_wake_word(audio):
+                    self.status_indicator.set_status(JarvisStatus.LISTENING)
+                    await self.handle_interaction()
+                else:
+                    self.status_indicator.set_status(JarvisStatus.IDLE)
                 
         except Exception as e:
             self.logger.error(f"Error in main loop: {str(e)}")
             self.status_indicator.set_status(JarvisStatus.ERROR)
             raise
             
+    async def _monitor_loop(self) -> None:
+        """Periodically check system resources while running."""
+        interval = self.config.get_setting('system', 'monitor_interval_s', default=3.0)
+        # Prime CPU sampling so later non-blocking reads cover a full interval
+        self.monitor.get_system_status(interval=None)
+        while self.running:
+            await asyncio.sleep(interval)
+            status = self.monitor.get_system_status(interval=None)
+            if status['cpu_percent'] > 90 or status['memory_percent'] > 90:
+                self.logger.warning("System resources critical!")
+            
     async def stop(self) -> None:
         """Stop JARVIS."""
         self.running = False
         self.logger.info("JARVIS is shutting down...")
-        await self.speak(
-            self.conversation.get_response('goodbye', mood='neutral')
-        )
+        self.voice.stop_capture()
+        try:
+            self.nlp.save()
+        except Exception as e:
+            self.logger.error(f"Error saving knowledge index: {str(e)}")
+        try:
+            await self.speak(
+                self.conversation.get_response('goodbye', mood='neutral')
+            )
+        finally:
+            self.voice.close()
         self.status_indicator.close()
         
     async def handle_interaction(self) -> None:
@@ -103,24 +126,25 @@ class Jarvis:
         try:
             # Listen for command
             self.logger.info("Listening for command...")
-            audio = await self.voice.listen()
-            if not audio:
+            text = await self.voice.listen(
+                timeout=self.config.get_setting('audio', 'command_timeout_s', default=10.0)
+            )
+            if not text:
                 self.status_indicator.set_status(JarvisStatus.IDLE)
                 return
                 
             # Process command
             self.status_indicator.set_status(JarvisStatus.PROCESSING)
-            text = await self.voice.transcribe(audio)
             self.logger.info(f"Received command: {text}")
             
+            # Analyze mood and intent in one pass
+            analysis = self.nlp.process_utterance(text)
+            intent = analysis['intent']
+            self.logger.info(f"Detected intent: {intent}")
+            
             # Update conversation context
             self.conversation.add_to_history('user', text)
-            mood = self.conversation.analyze_mood(text)
-            self.conversation.update_context(current_mood=mood)
-            
-            # Analyze intent
-            intent = self.nlp.get_intent(text)
-            self.logger.info(f"Detected intent: {intent}")
+            self.conversation.update_context(current_mood=analysis['mood'])
             
             # Execute command
             response = await self.execute_command(text, intent)
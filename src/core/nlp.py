@@ -1,16 +1,34 @@
 """Natural Language Processing for JARVIS."""
 import os
+import pickle
+import re
+from functools import cached_property, lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import json
 
 import numpy as np
-from transformers import pipeline
-from sentence_transformers import SentenceTransformer
-import spacy
-import faiss
 
 from ..config import Config
 from ..utils.exceptions import ConfigError
+from ..utils.files import atomic_path
+from ..utils.keywords import KeywordMatcher
+from .conversation import DEFAULT_MOOD_KEYWORDS
+
+# Used when responses.yaml has no intent_keywords; earlier intents win ties
+DEFAULT_INTENT_KEYWORDS: Dict[str, List[str]] = {
+    'search': ['search', 'find', 'look'],
+    'launch': ['open', 'launch', 'start'],
+    'stop': ['close', 'exit', 'stop'],
+}
+
+# Filler words allowed between a command verb and its target
+_TARGET_FILLERS = ('the', 'my', 'a', 'an', 'up', 'for')
+
+# spaCy components each analysis does not need
+_INTENT_DISABLE = ['ner']
+_ENTITY_DISABLE = ['tagger', 'parser', 'attribute_ruler', 'lemmatizer']
+_KEYWORD_DISABLE = ['parser', 'ner']
 
 class NLPManager:
     """Handle natural language processing tasks."""
@@ -23,16 +41,106 @@ class NLPManager:
         """
         self.config = config
         
-        # Load models
-        self.sentiment_analyzer = pipeline("sentiment-analysis")
-        self.embedder = SentenceTransformer('all-MiniLM-L6-v2')
-        self.nlp = spacy.load('en_core_web_sm')
-        
-        # Initialize FAISS index for semantic search
+        # Models and the FAISS index are loaded on first use
         self.embedding_dim = 384  # Dimension of sentence embeddings
-        self.index = faiss.IndexFlatL2(self.embedding_dim)
         self.stored_texts = []
         
+        # Knowledge persisted across restarts, when a path is configured
+        index_path = config.get_setting('paths', 'faiss_index')
+        self.index_path = Path(index_path) if index_path else None
+        self._index_readonly = False
+        self._index_dirty = False
+        if self._has_saved_index():
+            with open(self._texts_path(), 'rb') as f:
+                self.stored_texts = pickle.load(f)
+        
+        # Reused FAISS query batch, avoids an allocation per search
+        self._query_buf = np.empty((1, self.embedding_dim), dtype=np.float32)
+        
+        # Switch to an approximate IVF-PQ index past this many vectors
+        self.ivf_threshold = config.get_setting('nlp', 'ivf_threshold', default=10000)
+        self.ivf_nprobe = config.get_setting('nlp', 'ivf_nprobe', default=16)
+        
+        # Knowledge texts waiting to be embedded in one batch
+        self.embed_batch_size = config.get_setting('nlp', 'embed_batch_size', default=64)
+        self._pending_texts: List[str] = []
+        
+        # Per-instance caches so repeated utterances skip model inference
+        self._sentiment_cached = lru_cache(maxsize=1024)(self._compute_sentiment)
+        self._utterance_cached = lru_cache(maxsize=1024)(self._compute_utterance)
+        self._query_embedding_cached = lru_cache(maxsize=2048)(self._compute_query_embedding)
+        
+        # Intent and mood keywords share one matcher so an utterance is
+        # scanned once for both
+        intent_keywords = config.get_response('intent_keywords', default=DEFAULT_INTENT_KEYWORDS)
+        mood_keywords = config.get_response('mood_keywords', default=DEFAULT_MOOD_KEYWORDS)
+        self._keyword_matcher = KeywordMatcher({
+            **{('intent', c): words for c, words in intent_keywords.items()},
+            **{('mood', m): words for m, words in mood_keywords.items()},
+        })
+        # Per category, so the action and target come from the same intent
+        # the keyword pass chose
+        self._target_res = {
+            category: re.compile(
+                rf"\b({'|'.join(map(re.escape, sorted(words, key=len, reverse=True)))})\s+"
+                rf"(?:(?:{'|'.join(_TARGET_FILLERS)})\s+)*(\w+)",
+                re.IGNORECASE
+            )
+            for category, words in intent_keywords.items() if words
+        }
+        
+    @cached_property
+    def sentiment_analyzer(self) -> Any:
+        """Sentiment analysis pipeline, loaded on first use."""
+        from transformers import pipeline
+        return pipeline("sentiment-analysis")
+    
+    @cached_property
+    def embedder(self) -> Any:
+        """Sentence embedding model, loaded on first use."""
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer('all-MiniLM-L6-v2')
+    
+    @cached_property
+    def nlp(self) -> Any:
+        """spaCy pipeline, loaded on first use."""
+        import spacy
+        return spacy.load('en_core_web_sm')
+    
+    @cached_property
+    def index(self) -> Any:
+        """FAISS index for semantic search, created on first use.
+        
+        Embeddings are L2-normalized, so inner product is cosine
+        similarity; vectors are stored as fp16 to halve the memory
+        scanned per query.
+        """
+        import faiss
+        if self._has_saved_index():
+            # Map the saved vectors from the page cache rather than reading
+            # them into memory; reopened writable on the first add
+            try:
+                index = faiss.read_index(
+                    str(self.index_path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                )
+            except RuntimeError:
+                return faiss.read_index(str(self.index_path))
+            self._index_readonly = True
+            return index
+        return faiss.IndexScalarQuantizer(
+            self.embedding_dim, faiss.ScalarQuantizer.QT_fp16,
+            faiss.METRIC_INNER_PRODUCT
+        )
+    
+    def _texts_path(self) -> Path:
+        """Get the path of the stored texts saved alongside the index."""
+        return self.index_path.with_suffix('.pkl')
+    
+    def _has_saved_index(self) -> bool:
+        """Check whether a saved index and its texts exist."""
+        return bool(self.index_path and self.index_path.exists()
+                    and self._texts_path().exists())
+    
     def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment of text.
         
@@ -43,15 +151,20 @@ class NLPManager:
             Dictionary containing sentiment analysis results
         """
         try:
-            result = self.sentiment_analyzer(text)[0]
-            return {
-                'label': result['label'],
-                'score': result['score'],
-                'is_positive': result['label'] == 'POSITIVE'
-            }
+            # The sentiment model is uncased, so lowercasing only improves hits
+            return dict(self._sentiment_cached(text.strip().lower()))
         except Exception as e:
             return {'label': 'NEUTRAL', 'score': 0.5, 'is_positive': True}
     
+    def _compute_sentiment(self, text: str) -> Dict[str, Any]:
+        """Run the sentiment model on normalized text."""
+        result = self.sentiment_analyzer(text)[0]
+        return {
+            'label': result['label'],
+            'score': result['score'],
+            'is_positive': result['label'] == 'POSITIVE'
+        }
+    
     def extract_entities(self, text: str) -> List[Dict[str, str]]:
         """Extract named entities from text.
         
@@ -61,20 +174,104 @@ class NLPManager:
         Returns:
             List of dictionaries containing entity information
         """
-        doc = self.nlp(text)
+        doc = self.nlp(text, disable=_ENTITY_DISABLE)
         return [{'text': ent.text, 'label': ent.label_} for ent in doc.ents]
     
+    def process_utterance(self, text: str) -> Dict[str, Any]:
+        """Detect mood and intent of an utterance in a single keyword pass.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Dictionary with the detected 'mood' and the 'intent' classification
+        """
+        result = self._utterance_cached(text.strip())
+        return {'mood': result['mood'], 'intent': dict(result['intent'])}
+    
+    def _compute_utterance(self, text: str) -> Dict[str, Any]:
+        """Detect mood and intent of stripped text."""
+        category, mood = self._match_keywords(text)
+        return {'mood': mood, 'intent': self._classify_intent(text, category)}
+    
+    def _match_keywords(self, text: str) -> Tuple[Optional[str], str]:
+        """Find the highest-priority intent category and mood in text.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Tuple of (intent category or None, mood)
+        """
+        found = self._keyword_matcher.matches(text)
+        matched = [c for c in self._keyword_matcher.categories if c in found]
+        category = next((name for kind, name in matched if kind == 'intent'), None)
+        mood = next((name for kind, name in matched if kind == 'mood'), 'neutral')
+        return category, mood
+    
     def get_intent(self, text: str) -> Dict[str, Any]:
         """Determine user intent from text.
         
         Args:
             text: Input text
             
+        Returns:
+            Dictionary containing intent classification
+        """
+        return self.process_utterance(text)['intent']
+    
+    def _classify_intent(self, text: str, category: Optional[str]) -> Dict[str, Any]:
+        """Classify intent given the keyword-matched category.
+        
+        Args:
+            text: Input text
+            category: Intent category matched by keyword, if any
+            
+        Returns:
+            Dictionary containing intent classification
+        """
+        # Keyword hits with an obvious target skip the spaCy parse
+        if category:
+            match = self._target_res[category].search(text)
+            if match or category == 'search':
+                return {
+                    'action': match.group(1).lower() if match else None,
+                    'target': match.group(2) if match else None,
+                    'confidence': 0.8,
+                    'category': category
+                }
+        return self._intent_from_doc(
+            text, self.nlp(text, disable=_INTENT_DISABLE), category
+        )
+    
+    def batch_get_intents(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Determine user intent for several texts at once.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            List of intent classifications, one per text
+        """
+        docs = self.nlp.pipe(texts, batch_size=32, disable=_INTENT_DISABLE)
+        return [
+            self._intent_from_doc(text, doc, self._match_keywords(text)[0])
+            for text, doc in zip(texts, docs)
+        ]
+    
+    def _intent_from_doc(self, text: str, doc: Any,
+                         category: Optional[str]) -> Dict[str, Any]:
+        """Classify intent from a parsed spaCy document.
+        
+        Args:
+            text: Input text
+            doc: spaCy document for the text
+            category: Intent category matched by keyword, if any
+            
         Returns:
             Dictionary containing intent classification
         """
         # Extract key verbs and objects
-        doc = self.nlp(text)
         verbs = [token.lemma_ for token in doc if token.pos_ == 'VERB']
         objects = [token.text for token in doc if token.dep_ in ('dobj', 'pobj')]
         
@@ -87,12 +284,8 @@ class NLPManager:
         
         # TODO: Implement more sophisticated intent classification
         # For now, use basic rule-based approach
-        if any(word in text.lower() for word in ['search', 'find', 'look']):
-            intent.update({'category': 'search', 'confidence': 0.8})
-        elif any(word in text.lower() for word in ['open', 'launch', 'start']):
-            intent.update({'category': 'launch', 'confidence': 0.8})
-        elif any(word in text.lower() for word in ['close', 'exit', 'stop']):
-            intent.update({'category': 'stop', 'confidence': 0.8})
+        if category:
+            intent.update({'category': category, 'confidence': 0.8})
         else:
             intent.update({'category': 'unknown', 'confidence': 0.5})
             
@@ -101,6 +294,9 @@ class NLPManager:
     def add_to_knowledge(self, text: str, metadata: Optional[Dict] = None) -> int:
         """Add text to semantic search index.
         
+        Embedding is deferred until ``embed_batch_size`` texts are pending
+        or the index is next searched.
+        
         Args:
             text: Text to add
             metadata: Optional metadata about the text
@@ -108,14 +304,73 @@ class NLPManager:
         Returns:
             Index of added text
         """
-        embedding = self.embedder.encode([text])[0]
-        self.index.add(np.array([embedding]))
         self.stored_texts.append({
             'text': text,
             'metadata': metadata or {}
         })
+        self._pending_texts.append(text)
+        if len(self._pending_texts) >= self.embed_batch_size:
+            self.flush()
         return len(self.stored_texts) - 1
     
+    def flush(self) -> None:
+        """Embed all pending knowledge texts and add them to the index."""
+        if not self._pending_texts:
+            return
+        embeddings = self.embedder.encode(
+            self._pending_texts,
+            batch_size=self.embed_batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        # Resolving the index first sets _index_readonly for a mapped index
+        index = self.index
+        if self._index_readonly:
+            import faiss
+            index = self.index = faiss.read_index(str(self.index_path))
+            self._index_readonly = False
+        if not index.is_trained:
+            index.train(embeddings)
+        index.add(embeddings)
+        self._pending_texts = []
+        self._index_dirty = True
+        self._maybe_upgrade_index()
+        
+    def save(self) -> None:
+        """Persist the index and stored texts to ``paths.faiss_index``."""
+        if not self.index_path:
+            return
+        self.flush()
+        if not self._index_dirty:
+            return
+        import faiss
+        
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_path(self.index_path) as tmp:
+            faiss.write_index(self.index, tmp)
+        with atomic_path(self._texts_path()) as tmp:
+            with open(tmp, 'wb') as f:
+                pickle.dump(self.stored_texts, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._index_dirty = False
+        
+    def _maybe_upgrade_index(self) -> None:
+        """Rebuild the index as IVF-PQ once it exceeds ``ivf_threshold``."""
+        import faiss
+        
+        count = self.index.ntotal
+        if count <= self.ivf_threshold or isinstance(self.index, faiss.IndexIVF):
+            return
+        vectors = self.index.reconstruct_n(0, count)
+        quantizer = faiss.IndexFlatIP(self.embedding_dim)
+        index = faiss.IndexIVFPQ(
+            quantizer, self.embedding_dim, int(np.sqrt(count)), 48, 8,
+            faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(vectors)
+        index.add(vectors)
+        index.nprobe = self.ivf_nprobe
+        self.index = index
+    
     def semantic_search(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
         """Search for semantically similar texts.
         
@@ -126,20 +381,26 @@ class NLPManager:
         Returns:
             List of dictionaries containing search results
         """
-        query_embedding = self.embedder.encode([query])[0]
-        distances, indices = self.index.search(
-            np.array([query_embedding]), k
-        )
+        self.flush()
+        self._query_buf[0] = self._query_embedding_cached(query.strip())
+        scores, indices = self.index.search(self._query_buf, k)
         
         results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx < len(self.stored_texts):
+        for score, idx in zip(scores[0], indices[0]):
+            # FAISS pads with -1 when fewer than k vectors are indexed
+            if 0 <= idx < len(self.stored_texts):
                 result = self.stored_texts[idx].copy()
-                result['similarity'] = 1 - (dist / 2)  # Convert distance to similarity
+                result['similarity'] = float(score)  # Cosine similarity
                 results.append(result)
                 
         return results
     
+    def _compute_query_embedding(self, query: str) -> np.ndarray:
+        """Embed a search query as a read-only normalized vector."""
+        embedding = self.embedder.encode([query], normalize_embeddings=True)[0]
+        embedding.flags.writeable = False
+        return embedding
+    
     def extract_keywords(self, text: str) -> List[Dict[str, Any]]:
         """Extract important keywords from text.
         
@@ -149,20 +410,33 @@ class NLPManager:
         Returns:
             List of dictionaries containing keyword information
         """
-        doc = self.nlp(text)
-        keywords = []
+        from spacy.attrs import IS_PUNCT, IS_STOP, POS
+        from spacy.symbols import ADJ, NOUN, PROPN, VERB
         
-        for token in doc:
-            if token.is_stop or token.is_punct:
-                continue
-            if token.pos_ in ('NOUN', 'PROPN', 'ADJ', 'VERB'):
-                keywords.append({
-                    'text': token.text,
-                    'lemma': token.lemma_,
-                    'pos': token.pos_,
-                    'importance': token.prob  # Log probability (lower is more important)
-                })
-                
-        # Sort by importance
-        keywords.sort(key=lambda x: x['importance'])
-        return keywords[:10]  # Return top 10 keywords 
\ No newline at end of file
+        doc = self.nlp(text, disable=_KEYWORD_DISABLE)
+        if not len(doc):
+            return []
+            
+        # Filter candidate tokens on parallel attribute columns
+        attrs = doc.to_array([POS, IS_STOP, IS_PUNCT])
+        candidates = np.flatnonzero(
+            (attrs[:, 1] == 0) & (attrs[:, 2] == 0)
+            & np.isin(attrs[:, 0], (NOUN, PROPN, ADJ, VERB))
+        )
+        # Log probability (lower is more important)
+        probs = np.fromiter((doc[int(i)].prob for i in candidates),
+                            dtype=np.float64, count=len(candidates))
+        
+        # Top 10 by importance; stable so ties keep document order
+        top = np.argsort(probs, kind='stable')[:10]
+        
+        keywords = []
+        for i in candidates[top]:
+            token = doc[int(i)]
+            keywords.append({
+                'text': token.text,
+                'lemma': token.lemma_,
+                'pos': token.pos_,
+                'importance': token.prob
+            })
+        return keywords 
\ No newline at end of file
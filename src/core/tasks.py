@@ -1,7 +1,9 @@
 """Task management and scheduling for JARVIS."""
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Union
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
 import logging
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -23,7 +25,11 @@ class TaskManager:
         self.config = config
         self.scheduler = AsyncIOScheduler()
         self.active_tasks: Dict[str, asyncio.Task] = {}
-        self.task_history: List[Dict[str, Any]] = []
+        self.task_history: Deque[Dict[str, Any]] = deque(
+            maxlen=config.get_setting('tasks', 'history_len', default=100)
+        )
+        # Latest history entry per task name, for names still in the history
+        self._history_by_name: Dict[str, Dict[str, Any]] = {}
         
         # Start the scheduler
         self.scheduler.start()
@@ -55,10 +61,10 @@ class TaskManager:
             result = await task
             
             # Record in history
-            self.task_history.append({
+            self._record_history({
                 'name': name,
                 'status': 'completed',
-                'timestamp': datetime.now(),
+                'timestamp': time.time(),
                 'duration': task.get_coro().cr_frame.f_locals.get('_start_time'),
                 'result': str(result)
             })
@@ -67,10 +73,10 @@ class TaskManager:
             
         except Exception as e:
             # Record failure in history
-            self.task_history.append({
+            self._record_history({
                 'name': name,
                 'status': 'failed',
-                'timestamp': datetime.now(),
+                'timestamp': time.time(),
                 'error': str(e)
             })
             raise TaskError(f"Task {name} failed: {str(e)}")
@@ -80,6 +86,20 @@ class TaskManager:
             if name in self.active_tasks:
                 del self.active_tasks[name]
                 
+    def _record_history(self, entry: Dict[str, Any]) -> None:
+        """Record a finished task in the history.
+        
+        Args:
+            entry: History entry for the task
+        """
+        # Forget a name once its latest entry falls out of the history
+        if len(self.task_history) == self.task_history.maxlen:
+            evicted = self.task_history[0]
+            if self._history_by_name.get(evicted['name']) is evicted:
+                del self._history_by_name[evicted['name']]
+        self.task_history.append(entry)
+        self._history_by_name[entry['name']] = entry
+        
     def schedule_task(self, 
                      name: str,
                      func: Callable,
@@ -167,11 +187,7 @@ class TaskManager:
             }
             
         # Check history
-        for entry in reversed(self.task_history):
-            if entry['name'] == name:
-                return entry
-                
-        return {'name': name, 'status': 'not_found'}
+        return self._history_by_name.get(name, {'name': name, 'status': 'not_found'})
         
     def get_all_tasks(self) -> Dict[str, List[Dict[str, Any]]]:
         """Get status of all tasks.
@@ -185,7 +201,7 @@ class TaskManager:
                 self.get_task_status(job.id) 
                 for job in self.scheduler.get_jobs()
             ],
-            'history': self.task_history[-10:]  # Last 10 completed tasks
+            'history': list(self.task_history)[-10:]  # Last 10 completed tasks
         }
         
     def __del__(self):
@@ -1,24 +1,77 @@
 """Voice processing and management for JARVIS."""
+import json
 import os
-import tempfile
-from typing import Any, Dict, List, Optional, Tuple
+import queue
+import threading
+from typing import Any, Deque, Dict, List, Optional, Tuple
 import asyncio
 import wave
+from collections import deque
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-import pyaudio
 import webrtcvad
 import sounddevice as sd
-import soundfile as sf
 import pyttsx3
-import whisper
-from vosk import Model, KaldiRecognizer
+import ctranslate2
+from faster_whisper import WhisperModel
 
 from ..config import Config
+from ..utils.audio_stats import peak_rms_zcr
 from ..utils.exceptions import VoiceError
 
+# Voice activity detection frame length, and VAD frames per capture block
+_VAD_FRAME_MS = 20
+_VAD_FRAMES_PER_BLOCK = 5
+
+# Decoding budget per second of speech, and the floor for short clips
+_ASR_TOKENS_PER_S = 4
+_ASR_MIN_TOKENS = 8
+
+# Whisper segments more likely silence than speech are dropped
+_NO_SPEECH_THRESHOLD = 0.7
+
+# How long close() waits for queued speech to finish
+_TTS_JOIN_TIMEOUT_S = 2.0
+
+# Spectral subtraction STFT frame length
+_NOISE_FRAME = 512
+
+# Overlap-add positions covered by less window weight pass the input through
+_MIN_WINDOW_SUM = 0.1
+
+def _resolve_future(future: asyncio.Future, result: Any) -> None:
+    """Complete a future from the event loop unless it was cancelled.
+    
+    Args:
+        future: Future to complete
+        result: Result to set; exceptions are set as the future's exception
+    """
+    if future.done():
+        return
+    if isinstance(result, Exception):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
+
 class VoiceManager:
-    """Handle voice input/output and audio processing."""
+    """Handle voice input/output and audio processing.
+    
+    Settings are read once at construction; later changes to ``config``
+    are not picked up.
+    """
+    
+    __slots__ = (
+        'config', 'sample_rate', 'frames_per_buffer', 'vad_frame', 'block_size',
+        '_vad_window', 'min_speech_frames', '_ring', '_write', 'max_segment',
+        '_noise_mag', '_noise_block',
+        'segments', '_stream', '_loop', '_speech_start', '_speech_len', '_speech_frames',
+        'vad', 'tts_engine', 'whisper_model',
+        'use_vosk', 'wake_threshold', 'vosk_model', 'wake_model', 'wake_phrases', '_wake_rec',
+        'asr_max_batch', '_asr_queue', '_asr_task', '_asr_buf',
+        'stream_samples', '_streaming', '_prefix_task', '_committed', '_hypothesis',
+        '_tts_queue', '_tts_thread', '_tts_closed',
+    )
     
     def __init__(self, config: Config):
         """Initialize voice manager.
@@ -30,22 +83,121 @@ class VoiceManager:
         self.sample_rate = config.get_setting('audio', 'sample_rate', default=16000)
         self.frames_per_buffer = config.get_setting('audio', 'frames_per_buffer', default=8000)
         
+        # webrtcvad only accepts 10, 20 or 30 ms frames of 16-bit PCM; the
+        # stream delivers several per callback to cut per-call overhead
+        self.vad_frame = self.sample_rate * _VAD_FRAME_MS // 1000
+        self.block_size = self.vad_frame * _VAD_FRAMES_PER_BLOCK
+        
+        # An utterance ends once a full window of VAD frames is silent
+        end_silence = config.get_setting('audio', 'end_silence_s', default=2.0)
+        min_speech = config.get_setting('audio', 'min_speech_s', default=0.2)
+        self._vad_window: Deque[bool] = deque(maxlen=int(end_silence * 1000 / _VAD_FRAME_MS))
+        self.min_speech_frames = int(min_speech * 1000 / _VAD_FRAME_MS)
+        
+        # Captured audio lands in a preallocated int16 ring buffer; a whole
+        # number of blocks so a block never straddles the wrap point
+        ring_seconds = config.get_setting('audio', 'ring_buffer_s', default=60)
+        ring_blocks = ring_seconds * self.sample_rate // self.block_size
+        self._ring = np.zeros(ring_blocks * self.block_size, dtype=np.int16)
+        self._write = 0
+        
+        # Utterances are cut at this length; capping them at half the ring
+        # keeps a finished segment intact for at least as long again
+        max_utterance = config.get_setting('audio', 'max_utterance_s', default=30)
+        if max_utterance * 2 > ring_seconds:
+            raise VoiceError(
+                f"audio.max_utterance_s ({max_utterance}) must be at most half of "
+                f"audio.ring_buffer_s ({ring_seconds})"
+            )
+        self.max_segment = int(max_utterance * self.sample_rate)
+        
+        # Noise magnitude spectrum for spectral subtraction, refreshed from
+        # the latest capture block VAD scored as silent (ring position)
+        self._noise_mag: Optional[np.ndarray] = None
+        self._noise_block: Optional[int] = None
+        
+        # Utterances segmented by the capture callback, as (start, length)
+        # sample positions in the ring buffer; None once capture stops
+        self.segments: asyncio.Queue = asyncio.Queue()
+        self._stream: Optional[sd.RawInputStream] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._speech_start: Optional[int] = None
+        self._speech_len = 0
+        self._speech_frames = 0
+        
         # Initialize audio components
         self.vad = webrtcvad.Vad(3)  # Aggressive VAD mode
-        self.audio = pyaudio.PyAudio()
-        self.tts_engine = pyttsx3.init()
         
-        # Load Whisper model for advanced speech recognition
-        self.whisper_model = whisper.load_model("base")
+        # Load Whisper model for advanced speech recognition; CTranslate2
+        # with int8 weights is several times faster than the reference model.
+        # On a GPU, activations stay in fp16 so the tensor cores are used
+        if ctranslate2.get_cuda_device_count() > 0:
+            device, compute_type = "cuda", "int8_float16"
+        else:
+            device, compute_type = "cpu", "int8"
+        self.whisper_model = WhisperModel("base", device=device, compute_type=compute_type)
         
-        # Initialize Vosk model for wake word detection
-        model_path = config.get_setting('paths', 'model')
-        if not os.path.exists(model_path):
-            raise VoiceError(f"Vosk model not found at {model_path}")
-        self.vosk_model = Model(model_path)
+        # Wake word detection uses a small keyword-spotting model; the full
+        # Vosk recognizer is only loaded when explicitly enabled
+        self.use_vosk = config.get_setting('audio', 'use_vosk', default=False)
+        self.wake_threshold = config.get_setting('audio', 'wake_threshold', default=0.5)
+        self.vosk_model = None
+        self.wake_model = None
+        if self.use_vosk:
+            from vosk import KaldiRecognizer, Model
+            
+            model_path = config.get_setting('paths', 'model')
+            if not os.path.exists(model_path):
+                raise VoiceError(f"Vosk model not found at {model_path}")
+            self.vosk_model = Model(model_path)
+            
+            # Restrict wake word decoding to the configured phrases
+            self.wake_phrases = tuple(
+                phrase.lower() for phrase in config.get_response('wake_phrases', default=['jarvis'])
+            )
+            # One recognizer reused across utterances; construction
+            # allocates the decoder state
+            self._wake_rec = KaldiRecognizer(
+                self.vosk_model, self.sample_rate,
+                json.dumps(list(self.wake_phrases) + ['[unk]'])
+            )
+            self._wake_rec.SetWords(False)
+        else:
+            from openwakeword.model import Model
+            
+            self.wake_model = Model(
+                wakeword_models=[config.get_setting('audio', 'wake_model', default='hey_jarvis')]
+            )
         
-        # Configure TTS properties
-        self._configure_tts()
+        # Utterances waiting for the transcription worker
+        self.asr_max_batch = config.get_setting('audio', 'asr_max_batch', default=8)
+        
+        # Float samples handed to Whisper are written into one reusable
+        # buffer that fits the longest utterance
+        self._asr_buf = np.empty(self.max_segment, dtype=np.float32)
+        
+        # Streaming transcription state for the utterance being listened to
+        stream_interval = config.get_setting('audio', 'stream_interval_s', default=1.0)
+        self.stream_samples = max(int(stream_interval * self.sample_rate), 1)
+        self._streaming = False
+        self._prefix_task: Optional[asyncio.Task] = None
+        self._committed: List[str] = []
+        self._hypothesis: List[str] = []
+        self._asr_queue: asyncio.Queue = asyncio.Queue()
+        self._asr_task: Optional[asyncio.Task] = None
+        
+        # pyttsx3 is not safe to drive from several threads, and SAPI5 ties
+        # its COM objects to the creating thread, so a single worker creates
+        # and owns the engine and speaks queued (text, future) requests
+        self.tts_engine = None
+        self._tts_closed = False
+        self._tts_queue: "queue.Queue[Optional[Tuple[str, asyncio.Future]]]" = queue.Queue()
+        self._tts_thread = threading.Thread(target=self._tts_loop, name='jarvis-tts', daemon=True)
+        self._tts_thread.start()
+        
+        # Compile (or load the cached) statistics kernel now rather than on
+        # the first utterance
+        peak_rms_zcr(np.zeros(1, dtype=np.float32))
         
     def _configure_tts(self) -> None:
         """Configure text-to-speech properties."""
@@ -55,9 +207,178 @@ class VoiceManager:
         self.tts_engine.setProperty('voice', male_voice.id)
         self.tts_engine.setProperty('rate', 175)  # Slightly faster than default
         
+    def _tts_loop(self) -> None:
+        """Create the TTS engine, then speak queued text until a None sentinel."""
+        error: Optional[Exception] = None
+        try:
+            self.tts_engine = pyttsx3.init()
+            self._configure_tts()
+        except Exception as e:
+            error = e
+        while True:
+            item = self._tts_queue.get()
+            if item is None:
+                if self.tts_engine is not None:
+                    self.tts_engine.stop()
+                # Nothing will speak requests that raced the shutdown
+                closed = VoiceError("speech output is closed")
+                while True:
+                    try:
+                        item = self._tts_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    if item is not None:
+                        item[1].get_loop().call_soon_threadsafe(_resolve_future, item[1], closed)
+            text, future = item
+            if error is not None:
+                future.get_loop().call_soon_threadsafe(_resolve_future, future, error)
+                continue
+            try:
+                self.tts_engine.say(text)
+                self.tts_engine.runAndWait()
+            except Exception as e:
+                future.get_loop().call_soon_threadsafe(_resolve_future, future, e)
+            else:
+                future.get_loop().call_soon_threadsafe(_resolve_future, future, None)
+                
+    def start_capture(self) -> None:
+        """Start streaming microphone audio into ``segments``.
+        
+        Must be called from the event loop that consumes ``segments``.
+        
+        Raises:
+            VoiceError: If the input stream cannot be opened
+        """
+        if self._stream:
+            return
+        try:
+            self._loop = asyncio.get_running_loop()
+            self._stream = sd.RawInputStream(
+                samplerate=self.sample_rate,
+                blocksize=self.block_size,
+                dtype='int16',
+                channels=1,
+                callback=self._on_audio
+            )
+            self._stream.start()
+        except Exception as e:
+            self._stream = None
+            raise VoiceError(f"Error opening audio input: {str(e)}")
+            
+    def stop_capture(self) -> None:
+        """Stop streaming microphone audio.
+        
+        A waiting ``next_segment`` call is woken and returns None. Call it
+        from the event loop thread.
+        """
+        if self._stream:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+            self.segments.put_nowait(None)
+            
+    def _on_audio(self, indata: Any, frames: int, time_info: Any, status: Any) -> None:
+        """Segment captured audio into utterances.
+        
+        Runs on the PortAudio thread; completed utterances are handed to
+        the event loop through ``segments``.
+        
+        Args:
+            indata: Raw int16 audio for one capture block
+            frames: Number of samples in ``indata``
+            time_info: PortAudio timing information
+            status: PortAudio status flags
+        """
+        start = self._write
+        # One read-only copy of the block; webrtcvad reads its native int16
+        # PCM straight from slices of it
+        raw = memoryview(bytes(indata))
+        self._ring[start:start + frames] = np.frombuffer(raw, dtype=np.int16)
+        self._write = (start + frames) % len(self._ring)
+        
+        # Classify each VAD frame in the block
+        step = self.vad_frame * 2
+        flags = [
+            self.vad.is_speech(raw[offset:offset + step], self.sample_rate)
+            for offset in range(0, len(raw), step)
+        ]
+        self._vad_window.extend(flags)
+        if self._speech_start is None:
+            if not any(flags):
+                self._noise_block = start
+                return
+            first = flags.index(True) * self.vad_frame
+            self._speech_start = start + first
+            self._speech_len = frames - first
+        else:
+            self._speech_len += frames
+        self._speech_frames += sum(flags)
+        
+        # Stop once the window is all silence or the utterance hits its cap
+        if any(self._vad_window) and self._speech_len + frames <= self.max_segment:
+            # Let a listener decode the utterance so far at each interval
+            if self._streaming and (
+                self._speech_len // self.stream_samples
+                > max(self._speech_len - frames, 0) // self.stream_samples
+            ):
+                self._loop.call_soon_threadsafe(
+                    self._on_prefix, self._speech_start, self._speech_len
+                )
+            return
+        segment = (self._speech_start, self._speech_len)
+        is_utterance = self._speech_frames >= self.min_speech_frames
+        self._speech_start = None
+        self._speech_len = 0
+        self._speech_frames = 0
+        if is_utterance:
+            self._loop.call_soon_threadsafe(self.segments.put_nowait, segment)
+            
+    def _read_segment(self, start: int, length: int) -> np.ndarray:
+        """Get captured samples from the ring buffer.
+        
+        Args:
+            start: Ring position of the first sample
+            length: Number of samples
+            
+        Returns:
+            int16 samples; a view into the ring unless the segment wraps
+        """
+        end = start + length
+        if end <= len(self._ring):
+            return self._ring[start:end]
+        return np.concatenate((self._ring[start:], self._ring[:end - len(self._ring)]))
+        
+    async def next_segment(self, timeout: float = None) -> Optional[np.ndarray]:
+        """Wait for the next spoken utterance.
+        
+        The returned samples are a view into the ring buffer. They stay
+        valid until capture wraps around to them, at least
+        ``audio.ring_buffer_s - audio.max_utterance_s`` seconds after the
+        utterance ended.
+        
+        Args:
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            int16 samples of the utterance, or None on timeout or once
+            capture stops
+        """
+        try:
+            segment = await asyncio.wait_for(self.segments.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if segment is None:
+            return None
+        return self._read_segment(*segment)
+            
     async def listen(self, timeout: float = None) -> Optional[str]:
         """Listen for voice input.
         
+        The utterance is transcribed while it is still being spoken: every
+        ``audio.stream_interval_s`` the audio so far is decoded, and words
+        on which two consecutive decodes agree are committed. Once speech
+        ends only the rest of the utterance is left to decode.
+        
         Args:
             timeout: Optional timeout in seconds
             
@@ -67,58 +388,145 @@ class VoiceManager:
         Raises:
             VoiceError: If there's an error processing audio
         """
+        self._committed = []
+        self._hypothesis = []
+        self._streaming = True
         try:
-            # Open audio stream
-            stream = self.audio.open(
-                format=pyaudio.paFloat32,
-                channels=1,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=self.frames_per_buffer
-            )
+            audio = await self.next_segment(timeout)
+        finally:
+            self._streaming = False
+            if self._prefix_task is not None:
+                self._prefix_task.cancel()
+                self._prefix_task = None
+        if audio is None:
+            return None
+        return await self.transcribe(audio, prefix=" ".join(self._committed))
+        
+    def _on_prefix(self, start: int, length: int) -> None:
+        """Start decoding the utterance captured so far.
+        
+        Called on the event loop by the capture callback. A prefix is
+        skipped while the previous one is still being decoded.
+        
+        Args:
+            start: Ring position of the utterance's first sample
+            length: Number of samples captured so far
+        """
+        if not self._streaming:
+            return
+        if self._prefix_task is not None and not self._prefix_task.done():
+            return
+        self._prefix_task = asyncio.create_task(
+            self._prefix_transcribe(self._read_segment(start, length).copy())
+        )
+        
+    async def _prefix_transcribe(self, audio: np.ndarray) -> None:
+        """Decode an utterance prefix and commit locally agreed words.
+        
+        Args:
+            audio: int16 samples of the utterance so far
+        """
+        try:
+            text = await self.transcribe(audio, prefix=" ".join(self._committed))
+        except VoiceError:
+            return
+        words = text.split()
+        # Local agreement: commit the longest common prefix of the last
+        # two hypotheses, never retracting what is already committed
+        agreed = 0
+        for previous, current in zip(self._hypothesis, words):
+            if previous != current:
+                break
+            agreed += 1
+        if agreed > len(self._committed):
+            self._committed = words[:agreed]
+        self._hypothesis = words
+        
+    async def transcribe(self, audio: np.ndarray, prefix: str = '') -> str:
+        """Transcribe an utterance.
+        
+        Utterances are queued for a background worker that transcribes
+        everything pending in one executor job, off the event loop.
+        
+        Args:
+            audio: int16 audio samples
+            prefix: Text already known to open the utterance; Whisper only
+                decodes what follows it
             
-            frames = []
-            silent_frames = 0
-            max_silent_frames = int(self.sample_rate / self.frames_per_buffer * 2)  # 2 seconds
-            
-            while True:
-                if timeout and len(frames) * self.frames_per_buffer / self.sample_rate > timeout:
-                    break
-                    
-                data = stream.read(self.frames_per_buffer)
-                frame = np.frombuffer(data, dtype=np.float32)
-                frames.append(frame)
-                
-                # Check for voice activity
-                is_speech = self.vad.is_speech(data, self.sample_rate)
-                if not is_speech:
-                    silent_frames += 1
-                else:
-                    silent_frames = 0
-                    
-                # Stop if silence threshold reached
-                if silent_frames > max_silent_frames and len(frames) > max_silent_frames:
-                    break
-            
-            stream.stop_stream()
-            stream.close()
-            
-            if not frames:
-                return None
+        Returns:
+            Transcribed text; empty if Whisper found no speech
+            
+        Raises:
+            VoiceError: If there's an error processing audio
+        """
+        if self._asr_task is None or self._asr_task.done():
+            self._asr_task = asyncio.create_task(self._asr_worker())
+        future = asyncio.get_running_loop().create_future()
+        await self._asr_queue.put((audio, prefix, future))
+        return await future
+        
+    async def _asr_worker(self) -> None:
+        """Transcribe queued utterances in batches."""
+        loop = asyncio.get_running_loop()
+        while True:
+            # Take whatever else is already queued; waiting for more would
+            # only delay the utterance at the head
+            batch = [await self._asr_queue.get()]
+            while len(batch) < self.asr_max_batch and not self._asr_queue.empty():
+                batch.append(self._asr_queue.get_nowait())
+            # Superseded prefix decodes are cancelled by their callers
+            batch = [item for item in batch if not item[2].done()]
+            if not batch:
+                continue
                 
-            # Convert frames to audio file
-            audio_data = np.concatenate(frames)
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                sf.write(temp_file.name, audio_data, self.sample_rate)
-                # Use Whisper for high-quality transcription
-                result = self.whisper_model.transcribe(temp_file.name)
-                os.unlink(temp_file.name)
+            results = await loop.run_in_executor(None, self._transcribe_batch, batch)
+            for (_, _, future), result in zip(batch, results):
+                _resolve_future(future, result)
                 
-            return result['text'].strip()
-            
-        except Exception as e:
-            raise VoiceError(f"Error during voice input: {str(e)}")
+    def _transcribe_batch(self, batch: List[Tuple[np.ndarray, str, asyncio.Future]]) -> List[Any]:
+        """Transcribe several utterances in order.
+        
+        Args:
+            batch: int16 audio samples, known text prefix and result future
+                per utterance
             
+        Returns:
+            Transcribed text, or a VoiceError, per utterance; None for
+            utterances cancelled while the batch ran
+        """
+        results: List[Any] = []
+        for audio, prefix, future in batch:
+            if future.done():
+                results.append(None)
+                continue
+            try:
+                # Whisper takes 16 kHz float32 samples directly, no WAV
+                # roundtrip; scale in one pass into the reusable buffer
+                n = min(len(audio), len(self._asr_buf))
+                audio_data = self._asr_buf[:n]
+                np.multiply(audio[:n], np.float32(1.0 / 32768.0), out=audio_data)
+                # Use Whisper for high-quality transcription. The capture is
+                # already VAD-segmented and each utterance stands alone, so
+                # decode greedily without timestamps, prompt conditioning or
+                # more tokens than the utterance could plausibly hold
+                max_tokens = max(int(n / self.sample_rate * _ASR_TOKENS_PER_S), _ASR_MIN_TOKENS)
+                segments, _ = self.whisper_model.transcribe(
+                    audio_data, language="en", vad_filter=False, beam_size=1,
+                    condition_on_previous_text=False, without_timestamps=True,
+                    max_new_tokens=max_tokens, prefix=prefix or None
+                )
+                text = " ".join(
+                    segment.text.strip() for segment in segments
+                    if segment.no_speech_prob <= _NO_SPEECH_THRESHOLD
+                ).strip()
+                # The forced prefix is not part of the decoded text
+                if prefix and not text.startswith(prefix):
+                    text = f"{prefix} {text}".strip()
+                results.append(text)
+            except Exception as e:
+                results.append(VoiceError(f"Error during voice input: {str(e)}"))
+        return results
+        
     async def speak(self, text: str) -> None:
         """Convert text to speech.
         
@@ -126,54 +534,147 @@ class VoiceManager:
             text: Text to speak
             
         Raises:
-            VoiceError: If there's an error during speech synthesis
+            VoiceError: If there's an error during speech synthesis, or
+                after ``close``
         """
+        if self._tts_closed:
+            raise VoiceError("Error during speech synthesis: speech output is closed")
         try:
-            # Run TTS in a thread pool to avoid blocking
-            await asyncio.get_event_loop().run_in_executor(
-                None, self.tts_engine.say, text
-            )
-            await asyncio.get_event_loop().run_in_executor(
-                None, self.tts_engine.runAndWait
-            )
+            # Hand off to the TTS worker to avoid blocking
+            future = asyncio.get_running_loop().create_future()
+            self._tts_queue.put((text, future))
+            await future
         except Exception as e:
             raise VoiceError(f"Error during speech synthesis: {str(e)}")
             
-    def detect_wake_word(self, audio_data: bytes) -> bool:
+    def detect_wake_word(self, audio_data: np.ndarray) -> bool:
         """Detect wake word in audio stream.
         
+        Only called on utterances the capture VAD has already classified
+        as speech, so silence never reaches the recognizer.
+        
         Args:
-            audio_data: Raw audio data
+            audio_data: int16 audio samples
             
         Returns:
             True if wake word detected, False otherwise
         """
         try:
-            rec = KaldiRecognizer(self.vosk_model, self.sample_rate)
-            rec.AcceptWaveform(audio_data)
-            result = rec.Result()
-            # Check for wake word in transcription
-            return "jarvis" in result.lower()
+            if self.use_vosk:
+                self._wake_rec.AcceptWaveform(audio_data.tobytes())
+                text = json.loads(self._wake_rec.FinalResult()).get('text', '')
+                self._wake_rec.Reset()
+                # Check for wake word in transcription
+                return any(phrase in text for phrase in self.wake_phrases)
+                
+            # Score every 80 ms frame of the utterance and take the peak
+            self.wake_model.reset()
+            predictions = self.wake_model.predict_clip(audio_data)
+            return any(
+                score > self.wake_threshold
+                for frame in predictions for score in frame.values()
+            )
         except Exception as e:
             raise VoiceError(f"Error during wake word detection: {str(e)}")
             
+    def _stft(self, audio_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Window audio into 50% overlapping Hann frames and transform them.
+        
+        Args:
+            audio_data: float32 audio at least one frame long
+            
+        Returns:
+            Tuple of (periodic Hann window, complex spectrum per frame)
+        """
+        frame, hop = _NOISE_FRAME, _NOISE_FRAME // 2
+        count = (len(audio_data) - frame) // hop + 1
+        window = np.hanning(frame + 1)[:-1].astype(np.float32)  # Periodic Hann
+        frames = sliding_window_view(audio_data, frame)[::hop][:count] * window
+        return window, np.fft.rfft(frames, axis=-1)
+        
+    def update_noise_profile(self, noise: np.ndarray) -> None:
+        """Estimate the noise spectrum from a sample of background noise.
+        
+        Args:
+            noise: float audio containing no speech, on the same scale as
+                the audio passed to ``adjust_for_noise``
+        """
+        noise = np.asarray(noise, dtype=np.float32)
+        if len(noise) < _NOISE_FRAME:
+            return
+        _, spectrum = self._stft(noise)
+        self._noise_mag = np.abs(spectrum).mean(axis=0)
+        
     def adjust_for_noise(self, audio_data: np.ndarray) -> np.ndarray:
         """Apply noise reduction to audio data.
         
+        Uses spectral subtraction: the noise magnitude spectrum is subtracted
+        from every frame of a 50% overlapping Hann-windowed STFT. The noise
+        estimate is refreshed from the most recent capture block VAD marked
+        silent, or set explicitly with ``update_noise_profile``; without one
+        only normalization is applied. The result is peak-normalized;
+        all-zero input stays zero.
+        
         Args:
-            audio_data: Input audio data
+            audio_data: Input float audio data, scaled to [-1, 1]
             
         Returns:
             Noise-reduced audio data
         """
-        # TODO: Implement more sophisticated noise reduction
-        # For now, just apply simple normalization
-        return audio_data / np.max(np.abs(audio_data))
+        block = self._noise_block
+        if block is not None:
+            self._noise_block = None
+            self.update_noise_profile(
+                self._ring[block:block + self.block_size] * np.float32(1.0 / 32768.0)
+            )
+            
+        hop = _NOISE_FRAME // 2
+        audio_data = np.asarray(audio_data, dtype=np.float32)
+        count = (len(audio_data) - _NOISE_FRAME) // hop + 1
+        if count > 0 and self._noise_mag is not None:
+            window, spectrum = self._stft(audio_data)
+            magnitude = np.abs(spectrum)
+            
+            # Scale each bin to the subtracted magnitude, keeping its phase
+            gain = np.maximum(magnitude - self._noise_mag, 0.0) / np.maximum(magnitude, 1e-10)
+            cleaned = np.fft.irfft(spectrum * gain, n=_NOISE_FRAME, axis=-1).astype(np.float32)
+            
+            # Overlap-add, dividing by the summed window weight; only the
+            # edges are not covered by two overlapping windows
+            output = np.zeros_like(audio_data)
+            weight = np.zeros_like(audio_data)
+            output[:count * hop].reshape(count, hop)[:] += cleaned[:, :hop]
+            output[hop:(count + 1) * hop].reshape(count, hop)[:] += cleaned[:, hop:]
+            weight[:count * hop].reshape(count, hop)[:] += window[:hop]
+            weight[hop:(count + 1) * hop].reshape(count, hop)[:] += window[hop:]
+            covered = weight >= _MIN_WINDOW_SUM
+            output[covered] /= weight[covered]
+            output[~covered] = audio_data[~covered]
+            audio_data = output
+        else:
+            # Nothing to filter; copy so normalization leaves the input alone
+            audio_data = audio_data.copy()
+            
+        # Normalize in place; silence is left as-is instead of dividing by zero
+        peak, _, _ = peak_rms_zcr(audio_data)
+        scale = np.float32(1.0 / peak) if peak > 1e-8 else np.float32(1.0)
+        np.multiply(audio_data, scale, out=audio_data)
+        return audio_data
         
-    def __del__(self):
-        """Cleanup audio resources."""
-        try:
-            self.audio.terminate()
-            self.tts_engine.stop()
-        except:
-            pass 
\ No newline at end of file
+    def close(self) -> None:
+        """Release audio resources.
+        
+        Stops capture, cancels pending transcription and shuts down the
+        TTS worker, waiting briefly for it to finish. Safe to call more
+        than once; call it from the event loop thread.
+        """
+        self.stop_capture()
+        for task in (self._prefix_task, self._asr_task):
+            if task is not None:
+                task.cancel()
+        self._prefix_task = None
+        self._asr_task = None
+        # The worker stops the engine on its own thread
+        self._tts_closed = True
+        self._tts_queue.put(None)
+        self._tts_thread.join(timeout=_TTS_JOIN_TIMEOUT_S)
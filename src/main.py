@@ -41,14 +41,16 @@ async def main() -> Optional[NoReturn]:
         # Initialize and start JARVIS
         jarvis = Jarvis()
         print("Starting JARVIS...")
-        print("Say 'Hey Jarvis' or any other wake phrase to begin!")
+        print("Say 'Hey Jarvis' to begin!")
         
-        await jarvis.start()
-        
-    except KeyboardInterrupt:
-        print("\nShutting down JARVIS...")
-        if 'jarvis' in locals():
+        # Ctrl+C under asyncio.run cancels this task rather than raising
+        # KeyboardInterrupt here, so shut down on the way out regardless
+        try:
+            await jarvis.start()
+        finally:
+            print("\nShutting down JARVIS...")
             await jarvis.stop()
+        
     except Exception as e:
         logging.error(f"Fatal error: {str(e)}")
         sys.exit(1)
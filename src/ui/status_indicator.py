@@ -12,6 +12,16 @@ class JarvisStatus(Enum):
     PROCESSING = "yellow"
     ERROR = "red"
 
+# Glow outline per status; anything else gets a white outline
+_STATUS_OUTLINES = {
+    JarvisStatus.LISTENING: '#00ff00',
+    JarvisStatus.PROCESSING: '#ffff00',
+}
+
+# Tk event pumping interval while idle and while the window is dragged
+_IDLE_INTERVAL = 0.25
+_DRAG_INTERVAL = 0.016
+
 class StatusIndicator:
     """Floating status indicator for JARVIS."""
     
@@ -30,6 +40,7 @@ class StatusIndicator:
         self._status_callback: Optional[Callable] = None
         self._dragging = False
         self._drag_start: Tuple[int, int] = (0, 0)
+        self._changed = asyncio.Event()
         
     def create_window(self) -> None:
         """Create the floating window."""
@@ -79,17 +90,15 @@ class StatusIndicator:
         Args:
             status: New status to display
         """
-        if self.circle_id and self.canvas:
+        if self.circle_id and self.canvas and status != self.status:
             self.status = status
-            self.canvas.itemconfig(self.circle_id, fill=status.value)
-            
             # Add glow effect based on status
-            if status == JarvisStatus.LISTENING:
-                self.canvas.itemconfig(self.circle_id, outline='#00ff00')
-            elif status == JarvisStatus.PROCESSING:
-                self.canvas.itemconfig(self.circle_id, outline='#ffff00')
-            else:
-                self.canvas.itemconfig(self.circle_id, outline='white')
+            self.canvas.itemconfig(
+                self.circle_id,
+                fill=status.value,
+                outline=_STATUS_OUTLINES.get(status, 'white')
+            )
+            self._changed.set()
                 
     def _start_drag(self, event: tk.Event) -> None:
         """Start window dragging.
@@ -128,11 +137,20 @@ class StatusIndicator:
         self._dragging = False
         
     async def update(self) -> None:
-        """Async update loop for the indicator."""
-        while True:
-            if self.window:
-                self.window.update()
-            await asyncio.sleep(0.01)  # Small delay to prevent high CPU usage
+        """Async update loop for the indicator.
+        
+        Redraws immediately when the status changes; otherwise Tk events
+        are only pumped every ``_IDLE_INTERVAL`` seconds, or faster while
+        the window is being dragged.
+        """
+        while self.window:
+            self.window.update()
+            interval = _DRAG_INTERVAL if self._dragging else _IDLE_INTERVAL
+            try:
+                await asyncio.wait_for(self._changed.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+            self._changed.clear()
             
     def close(self) -> None:
         """Close the indicator window."""
@@ -0,0 +1,39 @@
+"""Audio signal statistics for JARVIS."""
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def peak_rms_zcr(x: np.ndarray) -> Tuple[float, float, float]:
+    """Compute peak amplitude, RMS and zero-crossing rate in one pass.
+
+    The loop is serial: the running peak and the previous-sample
+    comparison are loop-carried, and LLVM vectorizes the reductions.
+
+    Args:
+        x: 1-D audio samples
+
+    Returns:
+        Tuple of (peak, rms, zero-crossing rate per sample); all zero for
+        empty input
+    """
+    n = x.shape[0]
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    peak = 0.0
+    total = 0.0
+    crossings = 0
+    prev = x[0] >= 0
+    for i in range(n):
+        v = x[i]
+        a = abs(v)
+        if a > peak:
+            peak = a
+        total += v * v
+        positive = v >= 0
+        if positive != prev:
+            crossings += 1
+        prev = positive
+    return peak, (total / n) ** 0.5, crossings / n
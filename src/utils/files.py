@@ -0,0 +1,30 @@
+"""File helpers for JARVIS."""
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+
+@contextmanager
+def atomic_path(path: Union[str, Path]) -> Iterator[str]:
+    """Provide a temporary path that atomically replaces ``path`` on success.
+
+    Args:
+        path: Destination file path
+
+    Yields:
+        Temporary file path in the same directory as the destination
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
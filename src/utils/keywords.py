@@ -0,0 +1,48 @@
+"""Keyword matching utilities for JARVIS."""
+import re
+from typing import Hashable, Iterable, List, Mapping, Optional, Set
+
+
+class KeywordMatcher:
+    """Match text against several keyword categories in a single regex pass."""
+    
+    def __init__(self, keywords: Mapping[Hashable, Iterable[str]]):
+        """Compile keyword categories into one pattern.
+        
+        Args:
+            keywords: Mapping of category to its keywords, in priority order
+        """
+        self.categories: List[Hashable] = list(keywords)
+        self._groups = {f'k{i}': category for i, category in enumerate(self.categories)}
+        alternatives = []
+        for group, category in self._groups.items():
+            # Longest first so multi-word phrases win over their prefixes
+            words = sorted(keywords[category], key=len, reverse=True)
+            if words:
+                alternatives.append(f"(?P<{group}>{'|'.join(map(re.escape, words))})")
+        self.pattern = re.compile(
+            rf"\b(?:{'|'.join(alternatives) or '(?!)'})\b", re.IGNORECASE
+        )
+        
+    def matches(self, text: str) -> Set[Hashable]:
+        """Get every category with a keyword in the text.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Set of matched categories
+        """
+        return {self._groups[m.lastgroup] for m in self.pattern.finditer(text)}
+    
+    def match(self, text: str) -> Optional[Hashable]:
+        """Get the highest-priority category with a keyword in the text.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Matched category or None
+        """
+        found = self.matches(text)
+        return next((c for c in self.categories if c in found), None)
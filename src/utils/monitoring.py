@@ -1,13 +1,23 @@
 """System monitoring utilities for JARVIS."""
 import os
+import time
 import psutil
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import Config
 from .exceptions import MonitoringError
 
 class SystemMonitor:
-    """Monitor system resources and processes."""
+    """Monitor system resources and processes.
+    
+    Settings are read once at construction; later changes to ``config``
+    are not picked up.
+    """
+    
+    __slots__ = (
+        'config', 'critical_paths', 'cpu_threshold', 'mem_threshold',
+        'snapshot_ttl', '_snap', '_snap_ts',
+    )
     
     def __init__(self, config: Config):
         """Initialize system monitor.
@@ -16,19 +26,48 @@ class SystemMonitor:
             config: JARVIS configuration instance
         """
         self.config = config
-        self.critical_paths = config.get_setting('system', 'critical_paths', default=[])
+        self.critical_paths = frozenset(config.get_setting('system', 'critical_paths', default=[]))
         self.cpu_threshold = config.get_setting('system', 'rogue_cpu_threshold', default=80)
         self.mem_threshold = config.get_setting('system', 'rogue_mem_threshold', default=80)
         
-    def get_system_status(self) -> Dict[str, float]:
+        # One process table sweep shared by every check within the TTL
+        self.snapshot_ttl = config.get_setting('system', 'snapshot_ttl_s', default=1.0)
+        self._snap: List[Dict[str, Any]] = []
+        self._snap_ts = float('-inf')
+        
+        # The first cpu_percent reading per process is always 0; prime it
+        for _ in psutil.process_iter(['cpu_percent']):
+            pass
+            
+    def _snapshot(self) -> List[Dict[str, Any]]:
+        """Get process information, refreshed at most once per TTL.
+        
+        Returns:
+            List of per-process info dictionaries
+        """
+        now = time.monotonic()
+        if now - self._snap_ts >= self.snapshot_ttl:
+            self._snap = [
+                proc.info for proc in psutil.process_iter(
+                    ['pid', 'name', 'exe', 'cpu_percent', 'memory_percent']
+                )
+            ]
+            self._snap_ts = now
+        return self._snap
+        
+    def get_system_status(self, interval: Optional[float] = 1) -> Dict[str, float]:
         """Get current system resource usage.
         
+        Args:
+            interval: Seconds to sample CPU usage over, blocking meanwhile.
+                None measures since the previous call without blocking.
+        
         Returns:
             Dictionary with CPU and memory usage percentages
         """
         try:
             return {
-                'cpu_percent': psutil.cpu_percent(interval=1),
+                'cpu_percent': psutil.cpu_percent(interval=interval),
                 'memory_percent': psutil.virtual_memory().percent,
                 'disk_percent': psutil.disk_usage('/').percent
             }
@@ -43,11 +82,11 @@ class SystemMonitor:
         """
         critical_processes = []
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'exe']):
-                if proc.info['exe'] and proc.info['exe'] in self.critical_paths:
+            for info in self._snapshot():
+                if info['exe'] and info['exe'] in self.critical_paths:
                     critical_processes.append({
-                        'pid': proc.info['pid'],
-                        'name': proc.info['name'],
+                        'pid': info['pid'],
+                        'name': info['name'],
                         'status': 'running'
                     })
             return critical_processes
@@ -62,18 +101,17 @@ class SystemMonitor:
         """
         try:
             hogs = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                try:
-                    if (proc.info['cpu_percent'] > self.cpu_threshold or 
-                        proc.info['memory_percent'] > self.mem_threshold):
-                        hogs.append({
-                            'pid': proc.info['pid'],
-                            'name': proc.info['name'],
-                            'cpu_percent': proc.info['cpu_percent'],
-                            'memory_percent': proc.info['memory_percent']
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            for info in self._snapshot():
+                # Fields psutil could not read are None
+                cpu = info['cpu_percent'] or 0.0
+                mem = info['memory_percent'] or 0.0
+                if cpu > self.cpu_threshold or mem > self.mem_threshold:
+                    hogs.append({
+                        'pid': info['pid'],
+                        'name': info['name'],
+                        'cpu_percent': cpu,
+                        'memory_percent': mem
+                    })
             return hogs
         except Exception as e:
             raise MonitoringError(f"Failed to find resource hogs: {str(e)}")
@@ -1,8 +1,9 @@
 """Test fixtures for JARVIS tests."""
 import asyncio
 import os
+import shutil
 from pathlib import Path
-from typing import AsyncGenerator, Generator
+from typing import Any, AsyncGenerator, Callable, Dict
 
 import pytest
 import yaml
@@ -10,11 +11,16 @@ import yaml
 from src.core.jarvis_core import Jarvis
 
 
-@pytest.fixture
-def config_dir(tmp_path: Path) -> Generator[Path, None, None]:
-    """Create a temporary config directory with test settings."""
-    config_path = tmp_path / "config"
+@pytest.fixture(scope="session")
+def config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a config directory with test settings, shared by all tests.
+    
+    Tests that modify the files should use ``make_config_dir`` instead.
+    """
+    base_path = tmp_path_factory.mktemp("cfg")
+    config_path = base_path / "config"
     config_path.mkdir()
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
     
     # Create test settings.yaml
     settings = {
@@ -28,15 +34,15 @@ def config_dir(tmp_path: Path) -> Generator[Path, None, None]:
             "rogue_mem_threshold": 30,
         },
         "paths": {
-            "model": str(tmp_path / "models"),
-            "voice_profile": str(tmp_path / "voice_profile.pkl"),
-            "database": str(tmp_path / "jarvis.db"),
-            "log_file": str(tmp_path / "jarvis.log"),
+            "model": str(base_path / "models"),
+            "voice_profile": str(base_path / "voice_profile.pkl"),
+            "database": str(base_path / "jarvis.db"),
+            "log_file": str(base_path / "jarvis.log"),
         }
     }
     
     with open(config_path / "settings.yaml", "w") as f:
-        yaml.dump(settings, f)
+        yaml.dump(settings, f, Dumper=dumper)
         
     # Create test responses.yaml
     responses = {
@@ -46,9 +52,30 @@ def config_dir(tmp_path: Path) -> Generator[Path, None, None]:
     }
     
     with open(config_path / "responses.yaml", "w") as f:
-        yaml.dump(responses, f)
+        yaml.dump(responses, f, Dumper=dumper)
         
-    yield config_path
+    return config_path
+
+
+@pytest.fixture
+def make_config_dir(config_dir: Path, tmp_path: Path) -> Callable[..., Path]:
+    """Copy the shared config directory for a test, optionally patching settings.
+    
+    Config caches written to the shared directory are not copied.
+    """
+    def make(**overrides: Dict[str, Any]) -> Path:
+        config_path = shutil.copytree(
+            config_dir, tmp_path / "config", ignore=shutil.ignore_patterns("*.pkl")
+        )
+        if overrides:
+            with open(config_path / "settings.yaml") as f:
+                settings = yaml.safe_load(f)
+            for section, values in overrides.items():
+                settings.setdefault(section, {}).update(values)
+            with open(config_path / "settings.yaml", "w") as f:
+                yaml.safe_dump(settings, f)
+        return config_path
+    return make
 
 
 @pytest.fixture
@@ -0,0 +1,31 @@
+"""Test audio signal statistics."""
+import numpy as np
+import pytest
+
+from src.utils.audio_stats import peak_rms_zcr
+
+
+def test_peak_rms_zcr_matches_numpy():
+    """Test the fused kernel against NumPy reference values."""
+    audio = np.random.default_rng(0).standard_normal(1000).astype(np.float32)
+
+    peak, rms, zcr = peak_rms_zcr(audio)
+
+    positive = audio >= 0
+    assert peak == pytest.approx(np.abs(audio).max(), rel=1e-6)
+    assert rms == pytest.approx(np.sqrt(np.mean(audio.astype(np.float64) ** 2)), rel=1e-5)
+    assert zcr == pytest.approx(np.count_nonzero(positive[1:] != positive[:-1]) / len(audio))
+
+
+def test_peak_rms_zcr_known_values():
+    """Test a small hand-checked signal."""
+    peak, rms, zcr = peak_rms_zcr(np.array([0.5, -1.0, 0.2, 0.3], dtype=np.float32))
+
+    assert peak == pytest.approx(1.0)
+    assert rms == pytest.approx(np.sqrt((0.25 + 1.0 + 0.04 + 0.09) / 4), rel=1e-6)
+    assert zcr == pytest.approx(0.5)
+
+
+def test_peak_rms_zcr_empty():
+    """Test that empty input gives zeros."""
+    assert peak_rms_zcr(np.zeros(0, dtype=np.float32)) == (0.0, 0.0, 0.0)
@@ -7,47 +7,6 @@ import yaml
 from src.config import Config
 
 
-@pytest.fixture
-def config_dir(tmp_path):
-    """Create a temporary config directory with test settings."""
-    config_path = tmp_path / "config"
-    config_path.mkdir()
-    
-    # Create test settings.yaml
-    settings = {
-        "audio": {
-            "sample_rate": 16000,
-            "frames_per_buffer": 8000,
-            "clap_threshold": 0.1,
-        },
-        "system": {
-            "rogue_cpu_threshold": 50,
-            "rogue_mem_threshold": 30,
-        },
-        "paths": {
-            "model": str(tmp_path / "models"),
-            "voice_profile": str(tmp_path / "voice_profile.pkl"),
-            "database": str(tmp_path / "jarvis.db"),
-            "log_file": str(tmp_path / "jarvis.log"),
-        }
-    }
-    
-    with open(config_path / "settings.yaml", "w") as f:
-        yaml.dump(settings, f)
-        
-    # Create test responses.yaml
-    responses = {
-        "greetings": ["Hello!", "Hi!", "Greetings!"],
-        "farewells": ["Goodbye!", "Bye!", "See you later!"],
-        "errors": ["Sorry, something went wrong.", "An error occurred."],
-    }
-    
-    with open(config_path / "responses.yaml", "w") as f:
-        yaml.dump(responses, f)
-        
-    return config_path
-
-
 def test_config_initialization(config_dir):
     """Test Config class initialization."""
     os.environ["JARVIS_CONFIG_DIR"] = str(config_dir)
@@ -88,4 +47,27 @@ def test_invalid_config_dir():
     """Test handling of invalid config directory."""
     os.environ["JARVIS_CONFIG_DIR"] = "/non/existent/path"
     with pytest.raises(FileNotFoundError):
-        Config() 
\ No newline at end of file
+        Config() 
+
+def test_yaml_cache_reused_until_source_changes(make_config_dir):
+    """Test that the pickled config cache tracks the YAML source."""
+    config_dir = make_config_dir()
+    assert not (config_dir / "settings.yaml.pkl").exists()
+    config = Config(str(config_dir))
+    assert (config_dir / "settings.yaml.pkl").exists()
+    assert Config(str(config_dir)).settings == config.settings
+    
+    with open(config_dir / "settings.yaml", "w") as f:
+        yaml.dump({"audio": {"sample_rate": 44100}}, f)
+        
+    assert Config(str(config_dir)).get_setting("audio", "sample_rate") == 44100
+
+
+def test_get_setting_partial_path(config_dir):
+    """Test that partial key paths resolve to subtrees."""
+    config = Config(str(config_dir))
+    
+    assert config.get_setting("audio")["sample_rate"] == 16000
+    assert config.get_setting("audio", "sample_rate", "extra", default=1) == 1
+    assert config.get_response("greetings", "happy", default=None) is None
+
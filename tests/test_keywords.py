@@ -0,0 +1,34 @@
+"""Test keyword matching."""
+from src.utils.keywords import KeywordMatcher
+
+
+def test_match_prefers_earlier_category():
+    """Test that the first category in priority order wins."""
+    matcher = KeywordMatcher({
+        "search": ["search", "find"],
+        "launch": ["open", "start"],
+    })
+
+    assert matcher.match("open the browser and find my files") == "search"
+    assert matcher.matches("open the browser and find my files") == {"search", "launch"}
+    assert matcher.match("start the music") == "launch"
+    assert matcher.match("nothing to see here") is None
+
+
+def test_match_whole_words_only():
+    """Test that keywords only match on word boundaries."""
+    matcher = KeywordMatcher({"search": ["search"], "happy": ["good day"]})
+
+    assert matcher.match("Search for cats") == "search"
+    assert matcher.match("searching for cats") is None
+    assert matcher.match("research cats") is None
+    assert matcher.match("have a GOOD DAY") == "happy"
+
+
+def test_empty_keywords_never_match():
+    """Test that categories without keywords are ignored."""
+    matcher = KeywordMatcher({"empty": [], "stop": ["stop"]})
+
+    assert matcher.categories == ["empty", "stop"]
+    assert matcher.match("stop now") == "stop"
+    assert KeywordMatcher({}).match("anything") is None
@@ -0,0 +1,55 @@
+"""Test NLP intent classification and knowledge index persistence."""
+import numpy as np
+
+from src.config import Config
+from src.core.nlp import NLPManager
+
+
+class FakeEmbedder:
+    """Stand-in for the sentence embedding model."""
+
+    def __init__(self):
+        self.rng = np.random.default_rng(0)
+
+    def encode(self, texts, **kwargs):
+        vectors = self.rng.standard_normal((len(texts), 384)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def make_nlp(config_dir):
+    """Create an NLPManager with a fake embedder."""
+    nlp = NLPManager(Config(str(config_dir)))
+    nlp.embedder = FakeEmbedder()
+    return nlp
+
+
+def test_index_survives_restart_and_later_flushes(make_config_dir, tmp_path):
+    """Test that flushes after a restart keep index ids aligned with texts."""
+    config_dir = make_config_dir(
+        paths={"faiss_index": str(tmp_path / "knowledge.faiss")},
+        nlp={"embed_batch_size": 2},
+    )
+
+    nlp = make_nlp(config_dir)
+    nlp.add_to_knowledge("first")
+    nlp.add_to_knowledge("second")
+    nlp.save()
+
+    # Two flushes after reopening the saved, memory-mapped index
+    nlp = make_nlp(config_dir)
+    for text in ("third", "fourth", "fifth", "sixth"):
+        nlp.add_to_knowledge(text)
+
+    assert len(nlp.stored_texts) == 6
+    assert nlp.index.ntotal == 6
+
+
+def test_intent_target_comes_from_matched_category(config_dir):
+    """Test that action and target use the verbs of the chosen intent."""
+    nlp = NLPManager(Config(str(config_dir)))
+
+    intent = nlp.get_intent("stop and open chrome")
+
+    assert intent["category"] == "launch"
+    assert intent["action"] == "open"
+    assert intent["target"] == "chrome"
@@ -0,0 +1,50 @@
+"""Test task history tracking."""
+import pytest
+
+from src.config import Config
+from src.core.tasks import TaskManager
+from src.utils.exceptions import TaskError
+
+
+async def fail(message):
+    """Task that always raises."""
+    raise ValueError(message)
+
+
+@pytest.mark.asyncio
+async def test_task_status_from_history(make_config_dir):
+    """Test that finished tasks are looked up by name."""
+    task_manager = TaskManager(Config(str(make_config_dir(tasks={"history_len": 3}))))
+    with pytest.raises(TaskError):
+        await task_manager.run_task("backup", fail, "disk full")
+
+    status = task_manager.get_task_status("backup")
+    assert status["status"] == "failed"
+    assert status["error"] == "disk full"
+    assert task_manager.get_task_status("missing") == {"name": "missing", "status": "not_found"}
+
+
+@pytest.mark.asyncio
+async def test_task_history_bounded(make_config_dir):
+    """Test that history keeps the newest entries and the latest per name."""
+    task_manager = TaskManager(Config(str(make_config_dir(tasks={"history_len": 3}))))
+    for i in range(5):
+        with pytest.raises(TaskError):
+            await task_manager.run_task(f"task{i % 2}", fail, str(i))
+
+    assert [entry["error"] for entry in task_manager.task_history] == ["2", "3", "4"]
+    assert task_manager.get_task_status("task0")["error"] == "4"
+    assert task_manager.get_task_status("task1")["error"] == "3"
+    assert len(task_manager.get_all_tasks()["history"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_task_history_index_forgets_evicted_names(make_config_dir):
+    """Test that names whose entries left the history are no longer indexed."""
+    task_manager = TaskManager(Config(str(make_config_dir(tasks={"history_len": 3}))))
+    for name in ("a", "b", "c", "d", "e"):
+        with pytest.raises(TaskError):
+            await task_manager.run_task(name, fail, name)
+
+    assert set(task_manager._history_by_name) == {"c", "d", "e"}
+    assert task_manager.get_task_status("a") == {"name": "a", "status": "not_found"}
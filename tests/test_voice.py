@@ -0,0 +1,75 @@
+"""Test voice audio processing."""
+import numpy as np
+
+from src.core.voice import VoiceManager
+
+
+def make_voice(noise_mag=None):
+    """Create a VoiceManager without opening any audio devices or models."""
+    voice = VoiceManager.__new__(VoiceManager)
+    voice._noise_mag = noise_mag
+    voice._noise_block = None
+    return voice
+
+
+def test_noise_reduction_round_trip_without_noise():
+    """Test that a zero noise estimate reconstructs the normalized input."""
+    voice = make_voice(noise_mag=np.zeros(257))
+    # Not a whole number of hops, so there is a trailing partial frame
+    audio = np.random.default_rng(0).standard_normal(4000).astype(np.float32)
+
+    cleaned = voice.adjust_for_noise(audio)
+
+    assert cleaned.dtype == np.float32
+    np.testing.assert_allclose(cleaned, audio / np.abs(audio).max(), atol=1e-5)
+
+
+def test_noise_reduction_suppresses_profiled_noise():
+    """Test that noise matching the profile is attenuated relative to speech."""
+    rng = np.random.default_rng(0)
+    voice = make_voice()
+    voice.update_noise_profile(0.05 * rng.standard_normal(1600).astype(np.float32))
+    t = np.arange(16000) / 16000
+    tone = np.where(t > 0.5, np.sin(2 * np.pi * 440 * t), 0.0)
+    audio = (tone + 0.05 * rng.standard_normal(16000)).astype(np.float32)
+
+    cleaned = voice.adjust_for_noise(audio)
+
+    def noise_to_tone(x):
+        return np.abs(x[1000:7000]).mean() / np.abs(x[9000:15000]).mean()
+    assert noise_to_tone(cleaned) < noise_to_tone(audio) / 2
+
+
+def test_noise_profile_taken_from_silent_capture_block():
+    """Test that the last silent capture block refreshes the noise profile."""
+    voice = make_voice()
+    voice.block_size = 1600
+    voice._ring = np.full(3200, 100, dtype=np.int16)
+    voice._noise_block = 1600
+
+    voice.adjust_for_noise(np.zeros(2048, dtype=np.float32))
+
+    assert voice._noise_block is None
+    assert voice._noise_mag.shape == (257,)
+    assert voice._noise_mag[0] > 0
+
+
+def test_noise_reduction_silence():
+    """Test that all-zero input stays zero instead of becoming NaN."""
+    voice = make_voice(noise_mag=np.zeros(257))
+
+    cleaned = voice.adjust_for_noise(np.zeros(2048, dtype=np.float32))
+
+    assert not np.isnan(cleaned).any()
+    assert not cleaned.any()
+
+
+def test_noise_reduction_short_input_not_modified():
+    """Test that input too short to filter is normalized into a copy."""
+    voice = make_voice(noise_mag=np.zeros(257))
+    audio = np.full(100, 0.5, dtype=np.float32)
+
+    cleaned = voice.adjust_for_noise(audio)
+
+    np.testing.assert_array_equal(cleaned, np.ones(100, dtype=np.float32))
+    assert audio[0] == 0.5